@@ -1,7 +1,12 @@
 const fs = require('fs');
+const os = require('os');
 const { generateParticleRorschach } = require('./generateRorschach');
 const { extractEthFeatures } = require('./utils/ethUtils');
 const { getColorSchemeFromEthFeatures } = require('./utils/colors');
+const { generateInWorker, runPool } = require('./utils/workerUtils');
+
+// zlib level used for --fastEncode (roughly 5x faster than the default 6)
+const FAST_COMPRESSION_LEVEL = 1;
 
 const SAMPLE_ADDRESSES = [
   '0x5B38Da6a701c568545dCfcB03FcB875f56beddC4', // jonbray.eth
@@ -165,6 +170,7 @@ function parseArgs() {
     outputPath: './output', // Default output path from params
     isTest: false,
     runExamples: false, // New flag for examples
+    fastEncode: false, // trade PNG file size for encode speed
   };
 
   for (let i = 0; i < args.length; i++) {
@@ -180,43 +186,61 @@ function parseArgs() {
       result.isTest = true;
     } else if (arg === '--examples') {
       result.runExamples = true;
+    } else if (arg === '--fastEncode') {
+      result.fastEncode = true;
     }
   }
 
   return result;
 }
 
+/**
+ * Get custom parameters for PNG encoding
+ * @param {boolean} fastEncode - Whether to favour encode speed over file size
+ * @returns {Object} Custom parameters to merge into the generation params
+ */
+function getEncodeParams(fastEncode) {
+  return fastEncode ? { compressionLevel: FAST_COMPRESSION_LEVEL } : {};
+}
+
 /**
  * Generate examples for multiple Ethereum addresses
+ * Each inkblot is rendered in its own worker thread, one per CPU core
+ * @param {Object} options - Example options
+ * @param {boolean} options.fastEncode - Use fast PNG encoding
  */
-async function generateExamples() {
+async function generateExamples({ fastEncode = false } = {}) {
   const OUTPUT_DIR = 'output/examples';
   const METADATA_DIR = 'output/examples/metadata';
 
   ensureDirs([OUTPUT_DIR, METADATA_DIR]);
 
+  const concurrency = Math.max(
+    1,
+    Math.min(os.cpus().length, SAMPLE_ADDRESSES.length)
+  );
   console.log(
-    `Generating inkblots for ${SAMPLE_ADDRESSES.length} addresses...`
+    `Generating inkblots for ${SAMPLE_ADDRESSES.length} addresses across ${concurrency} workers...`
   );
 
-  for (let i = 0; i < SAMPLE_ADDRESSES.length; i++) {
-    const address = SAMPLE_ADDRESSES[i];
-    console.log(
-      `\nGenerating for address ${i + 1}/${SAMPLE_ADDRESSES.length}: ${address}`
-    );
-
+  const tasks = SAMPLE_ADDRESSES.map((address, i) => async () => {
     const outputFilename = generateOutputFilename(address);
     const outputPath = `${OUTPUT_DIR}/${outputFilename}`;
 
     // generate inkblot
-    const imageBuffer = generateParticleRorschach(address, {
-      size: 1024,
-      outputPath: outputPath,
-    });
+    await generateInWorker(
+      address,
+      { size: 1024, outputPath: outputPath, ...getEncodeParams(fastEncode) },
+      outputPath
+    );
 
-    fs.writeFileSync(outputPath, imageBuffer);
+    console.log(
+      `Generated address ${i + 1}/${SAMPLE_ADDRESSES.length}: ${address}`
+    );
     saveMetadata(address, outputFilename, 1024, METADATA_DIR);
-  }
+  });
+
+  await runPool(tasks, concurrency);
 
   console.log('\nAll inkblots generated successfully!');
 }
@@ -229,7 +253,7 @@ async function main() {
 
   // --examples flag: run the example addresses
   if (args.runExamples) {
-    await generateExamples();
+    await generateExamples({ fastEncode: args.fastEncode });
     return;
   }
 
@@ -251,9 +275,13 @@ async function main() {
   if (args.isTest) {
     console.log('- Test mode: Using default parameters');
   }
+  if (args.fastEncode) {
+    console.log('- Fast encode: Using minimal PNG compression');
+  }
 
   const imageBuffer = generateParticleRorschach(args.ethAddress, {
     size: args.size,
+    ...getEncodeParams(args.fastEncode),
   });
 
   fs.writeFileSync(outputPath, imageBuffer);
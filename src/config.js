@@ -10,6 +10,8 @@ module.exports = {
     outputPath: './output',
     horizontalMargin: 0.1,
     verticalMargin: 0.25,
+    compressionLevel: 6, // zlib level for PNG output (0-9, lower = faster encode)
+    showProgress: true, // log the render header and per-frame progress dots
   },
 
   particleParams: {
@@ -19,7 +21,6 @@ module.exports = {
 
     // noise function parameters
     noise: {
-      CACHE_PRECISION: 4,
       PERMUTATION_SIZE: 256,
     },
 
@@ -39,7 +39,7 @@ function generateParticleRorschach(ethAddress, customParams = {}) {
 
   // Extract features from Ethereum address if provided
   let ethFeatures = null;
-  let seededRandom = createSeededRandom();
+  let seededRandom;
   let colors;
   let isInverted = false;
   let is420Address = false;
@@ -96,6 +96,9 @@ function generateParticleRorschach(ethAddress, customParams = {}) {
     };
     const colorScheme = getColorSchemeFromEthFeatures(ethFeatures);
     colors = colorScheme.colors;
+
+    // Seed from the generated features so the reported seed reproduces the image
+    seededRandom = createSeededRandom(ethFeatures.seed);
   }
 
   // Create noise function from seeded random
@@ -0,0 +1,21 @@
+/**
+ * Worker thread entry point: generates a single inkblot and writes it to disk
+ *
+ * @module generateWorker
+ * @requires generateRorschach
+ */
+
+const fs = require('fs');
+const { parentPort, workerData } = require('worker_threads');
+const { generateParticleRorschach } = require('./generateRorschach');
+
+const { address, params, outputPath } = workerData;
+
+// several workers render at once, so keep their progress output quiet
+const imageBuffer = generateParticleRorschach(address, {
+  ...params,
+  showProgress: false,
+});
+fs.writeFileSync(outputPath, imageBuffer);
+
+parentPort.postMessage(outputPath);
@@ -1,6 +1,6 @@
 const fs = require('fs');
 const path = require('path');
-const { generateParticleRorschach } = require('./generateRorschach');
+const { generateInWorker, runPool } = require('./utils/workerUtils');
 
 // Create test output directory if it doesn't exist
 const testDir = path.join(__dirname, '../output/test');
@@ -21,44 +21,40 @@ function generateRandomAddress() {
 // Generate 20 random addresses and their inkblots
 async function generateTestSet() {
   const addresses = [];
-  const results = [];
+  for (let i = 0; i < 20; i++) {
+    addresses.push(generateRandomAddress());
+  }
 
   console.log('Generating 20 test addresses and inkblots...');
 
-  for (let i = 0; i < 20; i++) {
-    const address = generateRandomAddress();
-    addresses.push(address);
-
+  // Each inkblot is independent, so render them across worker threads
+  const tasks = addresses.map((address, i) => async () => {
     const outputPath = path.join(testDir, `inkblot_${i + 1}.png`);
 
     try {
-      // Generate the inkblot and get the buffer
-      const imageBuffer = generateParticleRorschach(address, {
-        size: 800,
-      });
+      // Generate the inkblot and save it to disk in a worker
+      await generateInWorker(address, { size: 800 }, outputPath);
 
-      // Save the image buffer to disk
-      fs.writeFileSync(outputPath, imageBuffer);
-
-      results.push({
+      console.log(`Generated inkblot ${i + 1}/20 for address ${address}`);
+      return {
         address,
         success: true,
         path: outputPath,
-      });
-
-      console.log(`Generated inkblot ${i + 1}/20 for address ${address}`);
+      };
     } catch (error) {
-      results.push({
-        address,
-        success: false,
-        error: error.message,
-      });
       console.error(
         `Failed to generate inkblot ${i + 1}/20 for address ${address}:`,
         error.message
       );
+      return {
+        address,
+        success: false,
+        error: error.message,
+      };
     }
-  }
+  });
+
+  const results = await runPool(tasks);
 
   // Save a summary file
   const summary = {
@@ -1,5 +1,21 @@
 const config = require('../config');
 
+/**
+ * Converts a hue offset to an RGB channel value
+ * @param {number} p - Lower chroma bound
+ * @param {number} q - Upper chroma bound
+ * @param {number} t - Hue offset (0-1, wrapped)
+ * @return {number} Channel value (0-1)
+ */
+function hueToRgb(p, q, t) {
+  if (t < 0) t += 1;
+  if (t > 1) t -= 1;
+  if (t < 1 / 6) return p + (q - p) * 6 * t;
+  if (t < 1 / 2) return q;
+  if (t < 2 / 3) return p + (q - p) * (2 / 3 - t) * 6;
+  return p;
+}
+
 /**
  * Converts HSL color to RGB
  * @param {number} h - Hue (0-360)
@@ -14,21 +30,12 @@ function hslToRgb(h, s, l) {
   if (s === 0) {
     r = g = b = l; // Achromatic
   } else {
-    const hue2rgb = (p, q, t) => {
-      if (t < 0) t += 1;
-      if (t > 1) t -= 1;
-      if (t < 1 / 6) return p + (q - p) * 6 * t;
-      if (t < 1 / 2) return q;
-      if (t < 2 / 3) return p + (q - p) * (2 / 3 - t) * 6;
-      return p;
-    };
-
     const q = l < 0.5 ? l * (1 + s) : l + s - l * s;
     const p = 2 * l - q;
 
-    r = hue2rgb(p, q, h + 1 / 3);
-    g = hue2rgb(p, q, h);
-    b = hue2rgb(p, q, h - 1 / 3);
+    r = hueToRgb(p, q, h + 1 / 3);
+    g = hueToRgb(p, q, h);
+    b = hueToRgb(p, q, h - 1 / 3);
   }
 
   return [
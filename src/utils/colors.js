@@ -194,6 +194,10 @@ function createColorString(color, alpha = 150) {
   return `rgba(${r}, ${g}, ${b}, ${alpha / 255})`;
 }
 
+// fixed scheme colors, built once rather than for every color scheme
+const WHITE_STRING = createColorString(COLORS.WHITE);
+const BLACK_STRING = createColorString(COLORS.BLACK);
+
 /**
  * Check if an address is a 420 address (starts or ends with 420)
  * @param {string} address - Ethereum address to check
@@ -274,8 +278,8 @@ function selectColorPair(ethFeatures) {
  * @returns {Array} Array of colors for the scheme
  */
 function generateColorScheme(pair, is420Special = false, isLessUnique = false) {
-  const white = createColorString(COLORS.WHITE);
-  const black = createColorString(COLORS.BLACK);
+  const white = WHITE_STRING;
+  const black = BLACK_STRING;
   const primary = createColorString(pair.primary);
   const secondary = createColorString(pair.secondary);
 
@@ -332,11 +336,12 @@ function generateColorScheme(pair, is420Special = false, isLessUnique = false) {
 function getColorSchemeFromEthFeatures(ethFeatures) {
   // Select a color pair based on the ETH address
   const colorPair = selectColorPair(ethFeatures);
+  const is420 = is420Address(ethFeatures.address);
 
   // Generate the color scheme from the selected pair
   const colors = generateColorScheme(
     colorPair,
-    is420Address(ethFeatures.address),
+    is420,
     ethFeatures.isLessUnique
   );
 
@@ -345,7 +350,7 @@ function getColorSchemeFromEthFeatures(ethFeatures) {
     primaryColor: colorPair.primary.name,
     secondaryColor: colorPair.secondary.name,
     colorPairName: colorPair.name,
-    is420Address: is420Address(ethFeatures.address),
+    is420Address: is420,
     isLessUnique: ethFeatures.isLessUnique,
   };
 }
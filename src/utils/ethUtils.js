@@ -4,14 +4,32 @@ const LESS_UNIQUE = {
   CONSECUTIVE_REPEAT_COUNT: 5, // no. consecutive repeating characters
 };
 
+const FEATURE_CACHE_SIZE = 1024; // max. addresses kept in the feature cache
+
+// features are a pure function of the address, so repeated lookups for the
+// same address are served from here. the cache is per thread: worker renders
+// each get their own copy, so it pays off for long-lived single-process
+// callers (and the single-address CLI) rather than the --examples batch.
+// entries are evicted first-in, first-out once the cache is full
+const featureCache = new Map();
+
+// hex digit value for each ASCII char code (-1 for non-hex characters)
+const HEX_VALUES = new Int8Array(128).fill(-1);
+for (let i = 0; i < 16; i++) {
+  HEX_VALUES['0123456789abcdef'.charCodeAt(i)] = i;
+}
+
 /**
  * Check if a string is a palindrome
  * @param {string} str - String to check
  * @returns {boolean} Whether the string is a palindrome
  */
 function isPalindrome(str) {
-  // Convert to array, reverse, and join back to string
-  return str === Array.from(str).reverse().join('');
+  // Compare characters from both ends without building a reversed copy
+  for (let i = 0, j = str.length - 1; i < j; i++, j--) {
+    if (str[i] !== str[j]) return false;
+  }
+  return true;
 }
 
 /**
@@ -27,13 +45,11 @@ function hasPalindromeEnding(str, n) {
 
 /**
  * Check if an address is less unique based on repeating characters
- * @param {string} address - Ethereum address to check
+ * @param {string} cleanAddress - Lowercased address without the 0x prefix
  * @returns {Object} Object containing whether address is less unique and if it has non-zero repeating characters
  */
-function isLessUniqueAddress(address) {
-  if (!address) return { isLessUnique: false, hasNonZeroRepeat: false };
-
-  const cleanAddress = address.slice(2).toLowerCase();
+function isLessUniqueAddress(cleanAddress) {
+  if (!cleanAddress) return { isLessUnique: false, hasNonZeroRepeat: false };
 
   // Check for N+ consecutive repeating characters anywhere
   let consecutiveCount = 1;
@@ -60,12 +76,12 @@ function isLessUniqueAddress(address) {
 
 /**
  * Determine the type trait for an address
- * @param {string} address - Ethereum address
+ * @param {string} cleanAddress - Lowercased address without the 0x prefix
  * @param {Object} ethFeatures - Features extracted from the address
  * @returns {string} The type trait
  */
-function determineTypeTrait(address, ethFeatures) {
-  const is420Address = address.toLowerCase().includes('420');
+function determineTypeTrait(cleanAddress, ethFeatures) {
+  const is420Address = cleanAddress.includes('420');
 
   if (is420Address) {
     return '420';
@@ -79,6 +95,8 @@ function determineTypeTrait(address, ethFeatures) {
 
 /**
  * Extract features from an Ethereum address
+ * Results are cached per address in this thread; callers always receive
+ * their own copy
  * @param {string} ethAddress - Ethereum address
  * @returns {Object} Features extracted from the address
  */
@@ -100,6 +118,11 @@ function extractEthFeatures(ethAddress) {
     };
   }
 
+  const cached = featureCache.get(ethAddress);
+  if (cached) {
+    return { ...cached };
+  }
+
   const cleanAddress = ethAddress.slice(2).toLowerCase();
 
   // count character types
@@ -109,22 +132,27 @@ function extractEthFeatures(ethAddress) {
   let highValues = 0;
   let evenChars = 0;
 
+  // single pass over char codes, classifying each by its hex value
   for (let i = 0; i < cleanAddress.length; i++) {
-    const char = cleanAddress[i];
-    if (char === '0') zeros++;
-    if (char === '1') ones++;
-    if (/[a-f]/.test(char)) letters++;
-    if (/[8-9a-f]/.test(char)) highValues++;
-    if (parseInt(char, 16) % 2 === 0) evenChars++;
+    const code = cleanAddress.charCodeAt(i);
+    const value = code < 128 ? HEX_VALUES[code] : -1;
+    if (value < 0) continue;
+
+    if (value === 0) zeros++;
+    if (value === 1) ones++;
+    if (value >= 10) letters++;
+    if (value >= 8) highValues++;
+    if (value % 2 === 0) evenChars++;
   }
 
   // calculate diversity
   const uniqueChars = new Set(cleanAddress).size;
   const diversity = uniqueChars / 16; // 16 possible hex chars
 
-  // create deterministic seed from address
-  const hash = crypto.createHash('sha256').update(cleanAddress).digest('hex');
-  const seed = parseInt(hash.slice(0, 8), 16);
+  // create deterministic seed from address (first 4 bytes of the digest,
+  // read directly rather than hex-encoding and re-parsing)
+  const digest = crypto.createHash('sha256').update(cleanAddress).digest();
+  const seed = digest.readUInt32BE(0);
 
   // check for palindromes of length 4 to address length
   let hasPalindrome = false;
@@ -136,7 +164,7 @@ function extractEthFeatures(ethAddress) {
   }
 
   // check for repeating characters
-  const { isLessUnique, hasNonZeroRepeat } = isLessUniqueAddress(ethAddress);
+  const { isLessUnique, hasNonZeroRepeat } = isLessUniqueAddress(cleanAddress);
 
   const features = {
     diversity: diversity,
@@ -152,9 +180,15 @@ function extractEthFeatures(ethAddress) {
     address: ethAddress,
   };
 
-  features.type = determineTypeTrait(ethAddress, features);
+  features.type = determineTypeTrait(cleanAddress, features);
+
+  // evict the oldest entry once the cache is full
+  if (featureCache.size >= FEATURE_CACHE_SIZE) {
+    featureCache.delete(featureCache.keys().next().value);
+  }
+  featureCache.set(ethAddress, features);
 
-  return features;
+  return { ...features };
 }
 
 /**
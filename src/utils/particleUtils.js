@@ -30,9 +30,6 @@ function createSeededRandom(seed) {
  * @returns {Function} Noise function
  */
 function createNoiseFunction(seededRandom) {
-  // Simple cache for noise values
-  const noiseCache = {};
-
   // Permutation table
   const perm = Array(512);
   for (let i = 0; i < config.particleParams.noise.PERMUTATION_SIZE; i++) {
@@ -59,19 +56,10 @@ function createNoiseFunction(seededRandom) {
   }
 
   // Return noise function
+  // Samples are computed directly: particles land on continuous coordinates,
+  // so a per-sample cache almost never hits and building its string keys
+  // costs more than evaluating the noise itself.
   return function (x, y, z = 0) {
-    // Create a cache key
-    const key = `${x.toFixed(
-      config.particleParams.noise.CACHE_PRECISION
-    )},${y.toFixed(config.particleParams.noise.CACHE_PRECISION)},${z.toFixed(
-      config.particleParams.noise.CACHE_PRECISION
-    )}`;
-
-    // Return cached value if available
-    if (noiseCache[key] !== undefined) {
-      return noiseCache[key];
-    }
-
     // Find unit grid cell containing point
     const X = Math.floor(x) & 255;
     const Y = Math.floor(y) & 255;
@@ -118,10 +106,8 @@ function createNoiseFunction(seededRandom) {
       )
     );
 
-    // Cache and return the result (normalize from -1...1 to 0...1)
-    const normalized = (result + 1) / 2;
-    noiseCache[key] = normalized;
-    return normalized;
+    // Normalize from -1...1 to 0...1
+    return (result + 1) / 2;
   };
 }
 
@@ -134,40 +120,35 @@ function createNoiseFunction(seededRandom) {
  */
 function getPlotter(value, colors, maxRadius) {
   const n = colors.length;
+  const {
+    COLOR_DISTRIBUTION_POWER,
+    RADIUS_CENTER,
+    RADIUS_NOISE_FREQUENCY,
+    RADIUS_BASE_SCALE,
+    RADIUS_VARIATION_SCALE,
+  } = config.particleParams.plotter;
 
   // Use a non-linear mapping to better distribute colors
-  const mappedValue = Math.pow(
-    value,
-    config.particleParams.plotter.COLOR_DISTRIBUTION_POWER
-  );
+  const mappedValue = Math.pow(value, COLOR_DISTRIBUTION_POWER);
+  const scaledValue = mappedValue * n;
 
-  // Size of an interval
-  const size = 1 / n;
   // Corresponding color index for the current value
-  const index = Math.floor(mappedValue * n);
+  const index = Math.floor(scaledValue);
   // Corresponding [0,1] in the current color interval
-  const valueInInterval = (mappedValue * n) % 1;
+  const valueInInterval = scaledValue % 1;
 
   // Enhanced radius calculation with more variety
-  const center = config.particleParams.plotter.RADIUS_CENTER;
-  const radiusScale = 2 * (center - Math.abs(valueInInterval - center));
+  const radiusScale =
+    2 * (RADIUS_CENTER - Math.abs(valueInInterval - RADIUS_CENTER));
 
   // Add some randomness to the radius while maintaining the overall structure
-  const noiseVariation = Math.pow(
-    Math.sin(
-      valueInInterval *
-        Math.PI *
-        config.particleParams.plotter.RADIUS_NOISE_FREQUENCY
-    ),
-    2
-  );
+  const wave = Math.sin(valueInInterval * Math.PI * RADIUS_NOISE_FREQUENCY);
+  const noiseVariation = wave * wave;
   const enhancedRadiusScale =
-    radiusScale *
-    (config.particleParams.plotter.RADIUS_BASE_SCALE +
-      config.particleParams.plotter.RADIUS_VARIATION_SCALE * noiseVariation);
+    radiusScale * (RADIUS_BASE_SCALE + RADIUS_VARIATION_SCALE * noiseVariation);
 
   return {
-    color: colors[Math.min(index, colors.length - 1)],
+    color: colors[Math.min(index, n - 1)],
     radius: maxRadius * enhancedRadiusScale,
   };
 }
@@ -199,44 +180,49 @@ function createSymmetricalParticle(
   const usableWidth = size * (1 - 2 * horizontalMargin);
   const usableHeight = size * (1 - 2 * verticalMargin);
 
+  // loop-invariant geometry, computed once per particle rather than per attempt
+  const halfUsableWidth = usableWidth / 2;
+  const left = size * horizontalMargin;
+  const top = size * verticalMargin;
+  const halfSize = size / 2;
+
+  // resolve tuning constants once rather than on every attempt
+  const { MAX_ATTEMPTS } = config.particleParams;
+  const { HORIZONTAL_WEIGHT, VERTICAL_WEIGHT, DISTANCE_FALLOFF_POWER } =
+    config.particleParams.distribution;
+
   // keep trying until we get a valid particle
   let attempts = 0;
   let x, y;
 
   do {
     // generate a point in the left half of the usable area, then adjust for margin
-    x = seededRandom() * (usableWidth / 2) + size * horizontalMargin;
-    y = seededRandom() * usableHeight + size * verticalMargin;
-
-    // calculate distance from center as normalized values (0 to 1)
-    const centerX = size / 2;
-    const centerY = size / 2;
+    x = seededRandom() * halfUsableWidth + left;
+    y = seededRandom() * usableHeight + top;
 
     // normalized distances from center (0 = center, 1 = furthest edge)
-    const dx = Math.abs(x - centerX) / (size / 2);
-    const dy = Math.abs(y - centerY) / (size / 2);
+    const dx = Math.abs(x - halfSize) / halfSize;
+    const dy = Math.abs(y - halfSize) / halfSize;
 
     // weight the distances differently
-    const weightedDist =
-      dx * config.particleParams.distribution.HORIZONTAL_WEIGHT +
-      dy * config.particleParams.distribution.VERTICAL_WEIGHT;
+    const weightedDist = dx * HORIZONTAL_WEIGHT + dy * VERTICAL_WEIGHT;
 
     // acceptance probability: higher near center, lower near edges
     const acceptanceProbability = Math.pow(
       1 - weightedDist,
-      config.particleParams.distribution.DISTANCE_FALLOFF_POWER
+      DISTANCE_FALLOFF_POWER
     );
 
     // accept the particle based on its weighted distance from center
     if (
       seededRandom() < acceptanceProbability ||
-      attempts > config.particleParams.MAX_ATTEMPTS
+      attempts > MAX_ATTEMPTS
     ) {
       break;
     }
 
     attempts++;
-  } while (attempts <= config.particleParams.MAX_ATTEMPTS);
+  } while (attempts <= MAX_ATTEMPTS);
 
   // create the mirrored point for perfect bilateral symmetry
   const mirrorX = size - x;
@@ -268,18 +254,26 @@ function createInvertedSymmetricalParticle(
   // use the smaller of width/2 or height/2 to ensure the circle fits
   const maxRadius = Math.min(usableWidth, usableHeight) / 2;
 
+  // loop-invariant geometry, computed once per particle rather than per attempt
+  const halfUsableWidth = usableWidth / 2;
+  const left = size * horizontalMargin;
+  const top = size * verticalMargin;
+  const centerX = size / 2;
+  const centerY = size / 2;
+
+  // resolve tuning constants once rather than on every attempt
+  const { MAX_ATTEMPTS } = config.particleParams;
+  const { LINEAR_FALLOFF_WEIGHT, CIRCULAR_FALLOFF_WEIGHT } =
+    config.particleParams.inverted;
+
   // keep trying until we get a valid particle
   let attempts = 0;
   let x, y;
 
   do {
     // generate a point in the left half of the usable area
-    x = seededRandom() * (usableWidth / 2) + size * horizontalMargin;
-    y = seededRandom() * usableHeight + size * verticalMargin;
-
-    // calculate distance from center as normalized values (0 to 1)
-    const centerX = size / 2;
-    const centerY = size / 2;
+    x = seededRandom() * halfUsableWidth + left;
+    y = seededRandom() * usableHeight + top;
 
     // calculate distance from center
     const dx = x - centerX;
@@ -288,26 +282,24 @@ function createInvertedSymmetricalParticle(
 
     // create a more organic boundary by combining linear and circular falloff
     const linearFalloff = Math.pow(1 - distanceFromCenter, 4);
-    const circularFalloff = Math.pow(
-      1 - distanceFromCenter * distanceFromCenter,
-      2
-    );
+    const radialRemainder = 1 - distanceFromCenter * distanceFromCenter;
+    const circularFalloff = radialRemainder * radialRemainder;
 
     // weight the falloffs to create a natural transition
     const acceptanceProbability =
-      linearFalloff * config.particleParams.inverted.LINEAR_FALLOFF_WEIGHT +
-      circularFalloff * config.particleParams.inverted.CIRCULAR_FALLOFF_WEIGHT;
+      linearFalloff * LINEAR_FALLOFF_WEIGHT +
+      circularFalloff * CIRCULAR_FALLOFF_WEIGHT;
 
     // accept the particle based on its distance from center
     if (
       seededRandom() < acceptanceProbability ||
-      attempts > config.particleParams.MAX_ATTEMPTS
+      attempts > MAX_ATTEMPTS
     ) {
       break;
     }
 
     attempts++;
-  } while (attempts <= config.particleParams.MAX_ATTEMPTS);
+  } while (attempts <= MAX_ATTEMPTS);
 
   // create the mirrored point for perfect bilateral symmetry
   const mirrorX = size - x;
@@ -338,18 +330,37 @@ function createStarSymmetricalParticle(
   // calculate the maximum radius for the star pattern
   const maxRadius = Math.min(usableWidth, usableHeight) / 2;
 
+  // loop-invariant geometry, computed once per particle rather than per attempt
+  const halfUsableWidth = usableWidth / 2;
+  const left = size * horizontalMargin;
+  const top = size * verticalMargin;
+  const centerX = size / 2;
+  const centerY = size / 2;
+
+  // resolve tuning constants once rather than on every attempt
+  const { MAX_ATTEMPTS } = config.particleParams;
+  const {
+    POINTS,
+    SUBPOINTS,
+    MAIN_POINTS_WEIGHT,
+    SUBPOINTS_WEIGHT,
+    ASYMMETRY_FREQUENCY,
+    ASYMMETRY_SCALE,
+    RADIAL_WEIGHT,
+    PATTERN_WEIGHT,
+    ASYMMETRY_WEIGHT,
+  } = config.particleParams.star;
+
   // keep trying until we get a valid particle
   let attempts = 0;
   let x, y;
 
   do {
     // generate a point in the left half of the usable area
-    x = seededRandom() * (usableWidth / 2) + size * horizontalMargin;
-    y = seededRandom() * usableHeight + size * verticalMargin;
+    x = seededRandom() * halfUsableWidth + left;
+    y = seededRandom() * usableHeight + top;
 
     // calculate distance from center
-    const centerX = size / 2;
-    const centerY = size / 2;
     const dx = x - centerX;
     const dy = y - centerY;
     const distanceFromCenter = Math.sqrt(dx * dx + dy * dy) / maxRadius;
@@ -362,37 +373,32 @@ function createStarSymmetricalParticle(
 
     // create 3.5-pointed leaf pattern (7 points total when mirrored)
     // use different frequencies to create more organic variation
-    const mainPoints = Math.pow(
-      Math.sin(angle * config.particleParams.star.POINTS),
-      2
-    );
-    const subPoints =
-      Math.pow(Math.sin(angle * config.particleParams.star.SUBPOINTS), 2) * 0.5;
+    const mainWave = Math.sin(angle * POINTS);
+    const subWave = Math.sin(angle * SUBPOINTS);
+    const mainPoints = mainWave * mainWave;
+    const subPoints = subWave * subWave * 0.5;
     const leafPattern =
-      mainPoints * config.particleParams.star.MAIN_POINTS_WEIGHT +
-      subPoints * config.particleParams.star.SUBPOINTS_WEIGHT;
+      mainPoints * MAIN_POINTS_WEIGHT + subPoints * SUBPOINTS_WEIGHT;
 
     // add some asymmetry to make it more leaf-like
-    const asymmetry =
-      Math.sin(angle * config.particleParams.star.ASYMMETRY_FREQUENCY) *
-      config.particleParams.star.ASYMMETRY_SCALE;
+    const asymmetry = Math.sin(angle * ASYMMETRY_FREQUENCY) * ASYMMETRY_SCALE;
 
     // combine patterns with weights
     const acceptanceProbability =
-      radialFalloff * config.particleParams.star.RADIAL_WEIGHT +
-      leafPattern * config.particleParams.star.PATTERN_WEIGHT +
-      asymmetry * config.particleParams.star.ASYMMETRY_WEIGHT;
+      radialFalloff * RADIAL_WEIGHT +
+      leafPattern * PATTERN_WEIGHT +
+      asymmetry * ASYMMETRY_WEIGHT;
 
     // accept the particle based on the combined pattern
     if (
       seededRandom() < acceptanceProbability ||
-      attempts > config.particleParams.MAX_ATTEMPTS
+      attempts > MAX_ATTEMPTS
     ) {
       break;
     }
 
     attempts++;
-  } while (attempts <= config.particleParams.MAX_ATTEMPTS);
+  } while (attempts <= MAX_ATTEMPTS);
 
   // create the mirrored point for bilateral symmetry
   const mirrorX = size - x;
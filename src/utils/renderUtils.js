@@ -41,9 +41,9 @@ function fadeCanvas(ctx, size, alpha) {
  * @returns {number} Normalized distance from center (0-1)
  */
 function calculateDistanceFromCenter(x, y, centerX, centerY, size) {
-  return Math.sqrt(
-    Math.pow((x - centerX) / size, 2) + Math.pow((y - centerY) / size, 2)
-  );
+  const dx = (x - centerX) / size;
+  const dy = (y - centerY) / size;
+  return Math.sqrt(dx * dx + dy * dy);
 }
 
 /**
@@ -67,29 +67,28 @@ function calculateAdjustedNoiseValue(noiseValue, distanceFromCenter) {
  * @returns {number} Final particle radius
  */
 function calculateParticleRadius(baseRadius, distanceFromCenter, maxRadius) {
+  const {
+    EDGE_FALLOFF_FACTOR,
+    EDGE_NOISE_FREQUENCY,
+    EDGE_NOISE_MULTIPLIER,
+    MIN_PARTICLE_SIZE_RATIO,
+  } = config.renderParams;
+
   // edge factor for organic particle falloff
-  const edgeFactor = Math.pow(distanceFromCenter, 2);
-  const sizeVariation =
-    1 - edgeFactor * config.renderParams.EDGE_FALLOFF_FACTOR;
+  const edgeFactor = distanceFromCenter * distanceFromCenter;
+  const sizeVariation = 1 - edgeFactor * EDGE_FALLOFF_FACTOR;
 
   // add randomness to edges
-  const edgeNoise = Math.pow(
-    Math.sin(
-      distanceFromCenter * Math.PI * config.renderParams.EDGE_NOISE_FREQUENCY
-    ),
-    2
+  const edgeWave = Math.sin(
+    distanceFromCenter * Math.PI * EDGE_NOISE_FREQUENCY
   );
+  const edgeNoise = edgeWave * edgeWave;
 
   const organicRadius =
-    baseRadius *
-    (sizeVariation *
-      (0.6 + config.renderParams.EDGE_NOISE_MULTIPLIER * edgeNoise));
+    baseRadius * (sizeVariation * (0.6 + EDGE_NOISE_MULTIPLIER * edgeNoise));
 
   // ensure minimum particle size
-  return Math.max(
-    organicRadius,
-    maxRadius * config.renderParams.MIN_PARTICLE_SIZE_RATIO
-  );
+  return Math.max(organicRadius, maxRadius * MIN_PARTICLE_SIZE_RATIO);
 }
 
 /**
@@ -111,15 +110,22 @@ function drawParticle(ctx, x, y, radius) {
  * @param {Object} particles - Particle positions (original and mirrored)
  * @param {string} color - Particle color
  * @param {number} radius - Particle radius
+ * @param {string} [currentColor] - Fill color already active on the context
+ * @returns {string} The fill color active after drawing
  */
-function renderParticlePair(ctx, particles, color, radius) {
-  ctx.fillStyle = color;
+function renderParticlePair(ctx, particles, color, radius, currentColor) {
+  // canvas re-parses fillStyle on every assignment, so only set it on change
+  if (color !== currentColor) {
+    ctx.fillStyle = color;
+  }
 
   // draw original particle (left side)
   drawParticle(ctx, particles.original.x, particles.original.y, radius);
 
   // draw mirrored particle (right side)
   drawParticle(ctx, particles.mirrored.x, particles.mirrored.y, radius);
+
+  return color;
 }
 
 /**
@@ -141,13 +147,17 @@ function renderFrame(ctx, params, state, createParticleFunc, noiseFunc) {
     verticalMargin,
   } = params;
 
-  const { frame, seededRandom, colors } = state;
+  const { frame, seededRandom, colors, getPlotter } = state;
   const centerX = size / 2;
   const centerY = size / 2;
+  const timeNoise = frame * speed;
 
   // fade the canvas
   fadeCanvas(ctx, size, params.fadeAlpha);
 
+  // track the active fill color so particle pairs can skip redundant sets
+  let fillColor = null;
+
   // generate and render particles
   for (let i = 0; i < particleCount; i++) {
     // create particle pair using the provided function
@@ -161,7 +171,6 @@ function renderFrame(ctx, params, state, createParticleFunc, noiseFunc) {
     // calculate noise value
     const xNoise = particles.original.x * scale;
     const yNoise = particles.original.y * scale;
-    const timeNoise = frame * speed;
     const noiseValue = noiseFunc(xNoise, yNoise, timeNoise);
 
     // calculate distance-based values
@@ -180,11 +189,7 @@ function renderFrame(ctx, params, state, createParticleFunc, noiseFunc) {
     );
 
     // get particle properties
-    const { color, radius } = state.getPlotter(
-      adjustedValue,
-      colors,
-      maxRadius
-    );
+    const { color, radius } = getPlotter(adjustedValue, colors, maxRadius);
 
     // calculate final radius with organic edge effects
     const finalRadius = calculateParticleRadius(
@@ -194,11 +199,17 @@ function renderFrame(ctx, params, state, createParticleFunc, noiseFunc) {
     );
 
     // render the particle pair
-    renderParticlePair(ctx, particles, color, finalRadius);
+    fillColor = renderParticlePair(
+      ctx,
+      particles,
+      color,
+      finalRadius,
+      fillColor
+    );
   }
 
   // output progress indicator
-  if (frame % 10 === 0) {
+  if (params.showProgress && frame % 10 === 0) {
     process.stdout.write('.');
   }
 }
@@ -215,9 +226,11 @@ function renderRorschach(canvasLib, params, state) {
   const centerX = params.size / 2;
   const centerY = params.size / 2;
 
-  console.log(
-    `Generating particle-based Rorschach with ${params.framesToRender} frames and ${params.particleCount} particles per frame...`
-  );
+  if (params.showProgress) {
+    console.log(
+      `Generating particle-based Rorschach with ${params.framesToRender} frames and ${params.particleCount} particles per frame...`
+    );
+  }
 
   // select particle creation function based on pattern type
   let createParticleFunc;
@@ -229,21 +242,23 @@ function renderRorschach(canvasLib, params, state) {
       : state.createSymmetricalParticle;
   }
 
+  // reuse one frame state rather than copying the full state every frame
+  const frameState = { ...state, frame: 0, centerX, centerY };
+
   // render all frames
   for (let frame = 0; frame < params.framesToRender; frame++) {
-    renderFrame(
-      ctx,
-      params,
-      { ...state, frame, centerX, centerY },
-      createParticleFunc,
-      state.noise
-    );
+    frameState.frame = frame;
+    renderFrame(ctx, params, frameState, createParticleFunc, state.noise);
   }
 
-  process.stdout.write('\n');
+  if (params.showProgress) {
+    process.stdout.write('\n');
+  }
 
   // return the image buffer
-  return canvas.toBuffer('image/png');
+  return canvas.toBuffer('image/png', {
+    compressionLevel: params.compressionLevel,
+  });
 }
 
 module.exports = {
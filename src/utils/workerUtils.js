@@ -0,0 +1,64 @@
+/**
+ * Worker thread utilities for batch inkblot generation
+ *
+ * Each inkblot is independent and CPU-bound, so batches are spread across
+ * worker threads instead of being rendered one after another.
+ */
+
+const os = require('os');
+const path = require('path');
+const { Worker } = require('worker_threads');
+
+const WORKER_SCRIPT = path.join(__dirname, '../generateWorker.js');
+
+/**
+ * Generate an inkblot in a worker thread and write it to disk
+ * @param {string} address - Ethereum address
+ * @param {Object} params - Custom generation parameters
+ * @param {string} outputPath - Path to write the PNG image to
+ * @returns {Promise<string>} Resolves with the output path once written
+ */
+function generateInWorker(address, params, outputPath) {
+  return new Promise((resolve, reject) => {
+    const worker = new Worker(WORKER_SCRIPT, {
+      workerData: { address, params, outputPath },
+    });
+
+    worker.once('message', resolve);
+    worker.once('error', reject);
+    worker.once('exit', (code) => {
+      if (code !== 0) {
+        reject(new Error(`Worker stopped with exit code ${code}`));
+      }
+    });
+  });
+}
+
+/**
+ * Run async tasks with a bounded number in flight
+ * @param {Function[]} tasks - Functions returning promises
+ * @param {number} concurrency - Maximum number of tasks running at once
+ * @returns {Promise<Array>} Task results, in task order
+ */
+async function runPool(tasks, concurrency = os.cpus().length) {
+  const results = new Array(tasks.length);
+  let next = 0;
+
+  const runners = Array.from(
+    { length: Math.max(1, Math.min(concurrency, tasks.length)) },
+    async () => {
+      while (next < tasks.length) {
+        const index = next++;
+        results[index] = await tasks[index]();
+      }
+    }
+  );
+
+  await Promise.all(runners);
+  return results;
+}
+
+module.exports = {
+  generateInWorker,
+  runPool,
+};